@@ -54,6 +54,9 @@ class StiCanController:
         sys.exit(self.app.exec())
     
     def drawPlot(self):
+        data = event_bus.takeChartData()
+        if data is None:
+            return
         print("to do")
         #counter so it doesnt draw every time
 
@@ -69,5 +69,5 @@ class BCIProcessor(abstractBCIProcessor):
 
     @staticmethod
     def signalData(data):
-        event_bus.dataforchart.emit(data)
+        event_bus.publishChartData(data)
         
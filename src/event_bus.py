@@ -1,7 +1,29 @@
-from PySide6.QtCore import QObject, Signal
+import numpy as np
+from PySide6.QtCore import QObject, QMutex, QMutexLocker, Signal
 
 class EventBus(QObject):
     dataforchart = Signal()
 
+    def __init__(self):
+        super().__init__()
+        # Latest chart data only; older frames are dropped, not queued
+        self._mutex = QMutex()
+        self._latest = None
+
+    def publishChartData(self, data):
+        with QMutexLocker(self._mutex):
+            pending = self._latest is not None
+            # Own a copy so the producer can reuse its array while the GUI reads
+            self._latest = np.array(data, copy=True)
+        # One notification in flight at a time, so the GUI queue can't back up
+        if not pending:
+            self.dataforchart.emit()
+
+    def takeChartData(self):
+        with QMutexLocker(self._mutex):
+            data = self._latest
+            self._latest = None
+        return data
+
 event_bus = EventBus()
 